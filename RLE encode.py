@@ -1,8 +1,22 @@
+import io
 import re
-from typing import List, Tuple, Dict
+from typing import Iterable, Optional, TextIO, Tuple, Dict
+import numpy as np
 from PIL import Image # NEW: Added for image processing
 import sys
-# Define the grid representation: 'o' for alive, '.' for dead.
+
+# Define the grid representation: every grid is a 2D np.uint8 array,
+# 1 for alive and 0 for dead. 'o'/'.' strings only appear at the edges
+# (RLE text and printed previews).
+ALIVE, DEAD = np.uint8(1), np.uint8(0)
+
+# RLE patterns, compiled once at import
+_X_RE = re.compile(r'x\s*=\s*\d+')
+_X_ANY_CASE_RE = re.compile(r'x\s*=\s*\d+', re.IGNORECASE)
+_HEADER_RE = re.compile(r'(x\s*=\s*\d+,\s*y\s*=\s*\d+,\s*rule\s*=\s*[bB]\d*/[sS]\d+)', re.IGNORECASE)
+_Y_RE = re.compile(r'y\s*=\s*\d+', re.IGNORECASE)
+_RULE_RE = re.compile(r'rule\s*=\s*[bB]\d*/[sS]\d+', re.IGNORECASE)
+_TOKEN_RE = re.compile(r'\d+|[bo$]')
 
 # --- RLE UTILITY FUNCTIONS (Original Code Kept) ---
 
@@ -11,21 +25,31 @@ def parse_rle_header(rle_string: str) -> Tuple[Dict[str, str], str]:
     Parses the header (x, y, rule) and the RLE data string from the full input.
     """
     # 1. Strip the comment/metadata section (up to the 'x = ...' line)
-    data_start = re.search(r'x\s*=\s*\d+', rle_string)
+    data_start = _X_RE.search(rle_string)
     if not data_start:
         raise ValueError("RLE file is missing the 'x = ...' header line.")
 
-    header_line_match = re.search(r'(x\s*=\s*\d+,\s*y\s*=\s*\d+,\s*rule\s*=\s*[bB]\d*/[sS]\d+)', rle_string, re.IGNORECASE)
+    # The one-line header starts with a case-insensitive 'x = <n>', so it
+    # cannot match before the first one
+    x_match = _X_ANY_CASE_RE.search(rle_string)
+    header_line_match = _HEADER_RE.search(rle_string, x_match.start())
 
     if not header_line_match:
-        # Fallback for simpler files that might not have the full header on one line
-        header_line_match = re.search(r'(x\s*=\s*\d+).*?(y\s*=\s*\d+).*?(rule\s*=\s*[bB]\d*/[sS]\d+)', rle_string, re.IGNORECASE | re.DOTALL)
-        if not header_line_match:
+        # Fallback for simpler files that might not have the full header on one
+        # line: the first 'y = <n>' after the first 'x = <n>', then the first
+        # 'rule = ...' after that. Each search only moves forward from where
+        # the previous one ended, so the scan stays linear however many
+        # 'x = <n>' appear without a complete header (a single DOTALL
+        # 'x.*?y.*?rule' regex retries every one of them and goes quadratic).
+        # If these first matches do not form a header, no later ones do either.
+        y_match = _Y_RE.search(rle_string, x_match.end())
+        rule_match = _RULE_RE.search(rle_string, y_match.end()) if y_match else None
+        if not rule_match:
             raise ValueError("Could not find a valid RLE header line.")
         
-        # Reconstruct header text from groups
-        header_text = f"{header_line_match.group(1)}, {header_line_match.group(2)}, {header_line_match.group(3)}"
-        rle_data_start_index = header_line_match.end()
+        # Reconstruct header text from the three parts
+        header_text = f"{x_match.group()}, {y_match.group()}, {rule_match.group()}"
+        rle_data_start_index = rule_match.end()
     else:
         header_text = header_line_match.group(1)
         # The pattern data starts immediately after the rule definition
@@ -44,192 +68,324 @@ def parse_rle_header(rle_string: str) -> Tuple[Dict[str, str], str]:
     return header, rle_data
 
 
-def decode_rle_data(rle_data: str, width: int, height: int) -> List[List[str]]:
-    """Decodes the RLE pattern data into a 2D grid."""
-    grid = [['.' for _ in range(width)] for _ in range(height)]
+def decode_rle_data(rle_data: str, width: int, height: int) -> np.ndarray:
+    """Decodes the RLE pattern data into a 2D uint8 grid."""
+    grid = np.zeros((height, width), dtype=np.uint8)
     row, col = 0, 0
     run_count = 0
 
-    cleaned_data = rle_data.rstrip('!').replace('$', ' $ ')
-    tokens = re.findall(r'\d+|[bo$]', cleaned_data)
+    tokens = _TOKEN_RE.findall(rle_data.rstrip('!'))
+
+    # Bind the per-token lookups to locals once
+    alive = ALIVE
+    _int = int
+    _min = min
 
     for token in tokens:
-        if token.isdigit():
-            run_count = int(token)
-        elif token in ('o', 'b'):
-            count = run_count if run_count > 0 else 1
-            cell_type = 'o' if token == 'o' else '.'
-
-            for _ in range(count):
-                if row < height and col < width:
-                    grid[row][col] = cell_type
-                    col += 1
+        if token == 'o':
+            # Fill the whole run at once, clipped to the grid bounds
+            if row < height:
+                end = _min(col + (run_count or 1), width)
+                grid[row, col:end] = alive
+                col = end
+            run_count = 0
+        elif token == 'b':
+            # The grid starts out dead and col only moves forward within a
+            # row, so a dead run just advances col
+            if row < height:
+                col = _min(col + (run_count or 1), width)
             run_count = 0
         elif token == '$':
-            count = run_count if run_count > 0 else 1
-            row += count
+            row += run_count or 1
             col = 0
             run_count = 0
+        else:
+            # _TOKEN_RE only yields 'o', 'b', '$' or a \d+ run count (which
+            # may be any Unicode digits, as int() accepts)
+            run_count = _int(token)
 
     return grid
 
 
-def encode_rle(grid: List[List[str]]) -> str:
-    """Encodes a 2D grid back into the RLE pattern data string."""
-    rle_lines = []
+def _encode_rle_row(row: np.ndarray) -> str:
+    """Encodes one uint8 row into RLE run tokens, without the trailing '$'."""
+    # Trailing dead cells are implied by the end of the row
+    alive = np.flatnonzero(row)
+    row = row[:alive[-1] + 1] if alive.size else row[:0]
 
-    def get_rle_char(cell):
-        return 'o' if cell == 'o' else 'b'
+    # Indices where the cell value changes; the -1 sentinels on both
+    # ends make the first and last run boundaries show up as well.
+    edges = np.flatnonzero(np.diff(row.view(np.int8), prepend=np.int8(-1), append=np.int8(-1)))
+    run_lengths = np.diff(edges).tolist()
+    run_values = row[edges[:-1]].tolist()
 
-    for i, row in enumerate(grid):
-        rle_row = ""
-        rle_chars = [get_rle_char(cell) for cell in row]
+    return ''.join(
+        (str(count) if count > 1 else "") + ('o' if value else 'b')
+        for count, value in zip(run_lengths, run_values)
+    )
 
-        while rle_chars and rle_chars[-1] == 'b':
-            rle_chars.pop()
 
-        if not rle_chars:
-            rle_lines.append('')
-            continue
+def encode_rle(grid: np.ndarray) -> str:
+    """Encodes a 2D uint8 grid back into the RLE pattern data string."""
+    buf = io.StringIO()
+    encode_rle_to(grid, buf)
+    return buf.getvalue()
 
-        current_char = rle_chars[0]
-        count = 0
-        for char in rle_chars:
-            if char == current_char:
-                count += 1
-            else:
-                rle_row += (str(count) if count > 1 else "") + current_char
-                current_char = char
-                count = 1
-
-        rle_row += (str(count) if count > 1 else "") + current_char
-        rle_lines.append(rle_row)
-
-    final_rle_data = ""
-    empty_row_count = 0
-
-    for line in rle_lines:
-        if line == '':
-            empty_row_count += 1
-        else:
-            if empty_row_count > 0:
-                final_rle_data += (str(empty_row_count) if empty_row_count > 1 else "") + '$'
-            
-            final_rle_data += line + '$'
-            empty_row_count = 0
 
-    return final_rle_data.rstrip('$') + '!'
+def encode_rle_to(grid: np.ndarray, fileobj: TextIO) -> int:
+    """
+    Encodes a 2D uint8 grid as RLE pattern data, writing it to fileobj row by
+    row instead of building the whole string. Any nonzero cell counts as alive.
+    Returns the number of characters written.
+    """
+    # The run search below relies on cells being exactly 0 or 1
+    grid = (np.asarray(grid) != 0).view(np.uint8)
+
+    # All-dead rows never produce tokens, so only visit the rows with a live cell
+    return _write_rle_rows(
+        ((i, _encode_rle_row(grid[i])) for i in np.flatnonzero(np.any(grid, axis=1)).tolist()),
+        fileobj,
+    )
+
+
+def _write_rle_rows(rows: Iterable[Tuple[int, str]], fileobj: TextIO) -> int:
+    """
+    Writes (row index, row tokens) pairs for the non-empty rows, in order, as
+    RLE pattern data. The gap since the previous row becomes a '$' run, and the
+    last row is closed with '!' instead of '$'. Returns the number of characters written.
+    """
+    written = 0
+    last_row = -1
+
+    for i, rle_row in rows:
+        # Close the previous row, then skip over the empty rows in between
+        empty_row_count = i - last_row - 1
+        parts = ['$'] if last_row >= 0 else []
+        if empty_row_count > 0:
+            parts.append((str(empty_row_count) if empty_row_count > 1 else "") + '$')
+        parts.append(rle_row)
+
+        written += fileobj.write(''.join(parts))
+        last_row = i
+
+    return written + fileobj.write('!')
 
 
-def tile_grid(base_grid: List[List[str]], repeat_x: int, repeat_y: int) -> List[List[str]]:
+def tile_grid(base_grid: np.ndarray, repeat_x: int, repeat_y: int) -> np.ndarray:
     """Tiles the base grid across a new larger grid."""
-    if not base_grid or not base_grid[0]:
-        return []
-        
-    base_height = len(base_grid)
-    base_width = len(base_grid[0])
-    
-    new_height = base_height * repeat_y
-    new_width = base_width * repeat_x
-    
-    new_grid = [['.' for _ in range(new_width)] for _ in range(new_height)]
-    
-    for ty in range(repeat_y):
-        for tx in range(repeat_x):
-            start_row = ty * base_height
-            start_col = tx * base_width
-            
-            for r in range(base_height):
-                for c in range(base_width):
-                    new_row = start_row + r
-                    new_col = start_col + c
-                    new_grid[new_row][new_col] = base_grid[r][c]
-                        
-    return new_grid
+    if base_grid.size == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    return np.tile(base_grid, (repeat_y, repeat_x))
 
 
 # --- IMAGE PROCESSING AND GLIDER TILING FUNCTIONS (NEW/MODIFIED) ---
 
-def image_to_pixel_map(image_path: str, threshold: int = 128) -> List[List[str]]:
+def image_to_pixel_map(image_path: str, threshold: int = 128) -> np.ndarray:
     """
-    Converts an image into a 2D grid ('o' for bright, '.' for dark) based on a brightness threshold.
+    Converts an image into a 2D uint8 grid (1 for bright, 0 for dark) based on a brightness threshold.
 
     Args:
         image_path: Path to the input image file.
-        threshold: Grayscale value (0-255) above which a pixel is considered 'bright' ('o').
+        threshold: Grayscale value (0-255) above which a pixel is considered 'bright' (1).
                    128 is a typical middle ground.
 
     Returns:
-        A 2D list representing the low-resolution pixel map.
+        A 2D uint8 ndarray representing the low-resolution pixel map.
     """
     try:
         # Open the image and convert it directly to grayscale ('L' mode)
         img = Image.open(image_path).convert('L')
     except FileNotFoundError:
         print(f"Error: Image file not found at '{image_path}'.")
-        return []
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    # Map each grayscale brightness (0=Black, 255=White) through a 256-entry
+    # lookup table inside PIL: bright pixels become 1 (will be replaced by a
+    # Glider later), dark pixels become 0 (will be left empty)
+    lut = bytes(ALIVE if value > threshold else DEAD for value in range(256))
+    return np.asarray(img.point(lut), dtype=np.uint8)
+
+
+_fill_tiles = None
+_fill_tiles_loaded = False
+
+
+def _load_fill_tiles():
+    """
+    Returns the Numba tile kernel, or None when Numba is not installed.
+
+    Numba is imported on the first call rather than at module load: importing
+    it takes a noticeable fraction of a second, and the glider pipeline never
+    builds the tiled grid, so only create_pixel_art_grid callers pay for it.
+    """
+    global _fill_tiles, _fill_tiles_loaded
+    if _fill_tiles_loaded:
+        return _fill_tiles
+    _fill_tiles_loaded = True
+
+    try:
+        from numba import njit, prange
     except ImportError:
-        print("Error: Pillow library not installed. Please run 'pip install Pillow'.")
-        return []
-
-    width, height = img.size
-    pixel_map = []
-    
-    # Iterate through rows (y) and columns (x)
-    for y in range(height):
-        row = []
-        for x in range(width):
-            # Get the grayscale brightness value (0=Black, 255=White)
-            brightness = img.getpixel((x, y)) 
-            
-            # Bright pixel gets an 'o' (will be replaced by a Glider later)
-            if brightness > threshold:
-                row.append('o')
-            # Dark pixel gets a '.' (will be left empty)
-            else:
-                row.append('.')
-        pixel_map.append(row)
-        
-    return pixel_map
+        # Numba is optional; without it the grid builder stays on plain NumPy
+        return None
+
+    @njit(cache=True, parallel=True)
+    def fill_tiles(pixel_art_map, base_pattern, out):
+        """
+        Copies base_pattern into every alive tile of the preallocated out grid.
+        Map rows write disjoint bands of out, so they are spread over threads.
+        """
+        base_height, base_width = base_pattern.shape
+        for map_r in prange(pixel_art_map.shape[0]):
+            for map_c in range(pixel_art_map.shape[1]):
+                if pixel_art_map[map_r, map_c]:
+                    start_row = map_r * base_height
+                    start_col = map_c * base_width
+                    out[start_row:start_row + base_height, start_col:start_col + base_width] = base_pattern
+
+    _fill_tiles = fill_tiles
+    return _fill_tiles
 
 
 def create_pixel_art_grid(
-    pixel_art_map: List[List[str]],
-    base_pattern: List[List[str]]
-) -> List[List[str]]:
+    pixel_art_map: np.ndarray,
+    base_pattern: np.ndarray,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
     """
     Creates a large grid by tiling a base pattern only where the 
-    pixel_art_map indicates an 'alive' cell ('o'). (Reused from previous turn).
+    pixel_art_map (a uint8 grid) indicates an 'alive' cell. (Reused from previous turn).
+
+    Any nonzero cell of either input counts as alive; a copy of base_pattern
+    is placed in every alive tile and the dead tiles are left empty. Uses the
+    Numba kernel when Numba is installed, otherwise a broadcast multiply.
+
+    The result is written in place into out when given (a C-contiguous uint8
+    array of the final size), so callers that build several grids of the
+    same size can reuse one buffer instead of allocating a new one each time.
+    If either input is empty the grid is empty too: out must then have no
+    cells and is returned as is, otherwise a (0, 0) grid is returned.
     """
-    if not base_pattern or not base_pattern[0] or not pixel_art_map:
-        return []
-        
-    base_height = len(base_pattern)
-    base_width = len(base_pattern[0])
-    map_height = len(pixel_art_map)
-    map_width = len(pixel_art_map[0])
-    
-    new_height = map_height * base_height
-    new_width = map_width * base_width
-    
-    new_grid = [['.' for _ in range(new_width)] for _ in range(new_height)]
-    
-    for map_r in range(map_height):
-        for map_c in range(map_width):
-            if pixel_art_map[map_r][map_c] == 'o':
-                start_row = map_r * base_height
-                start_col = map_c * base_width
-                
-                # Copy the base pattern into the tile area
-                for r in range(base_height):
-                    for c in range(base_width):
-                        new_row = start_row + r
-                        new_col = start_col + c
-                        # Only copy the alive cells from the base pattern
-                        if base_pattern[r][c] == 'o':
-                            new_grid[new_row][new_col] = 'o'
-                            
-    return new_grid
+    if base_pattern.size == 0 or pixel_art_map.size == 0:
+        if out is None:
+            return np.zeros((0, 0), dtype=np.uint8)
+        if out.size != 0 or out.dtype != np.uint8:
+            raise ValueError("out must be an empty uint8 array when either input is empty.")
+        return out
+
+    # Normalize to 0/1 so both backends below produce the same grid
+    pixel_art_map = np.ascontiguousarray(np.asarray(pixel_art_map) != 0).view(np.uint8)
+    base_pattern = np.ascontiguousarray(np.asarray(base_pattern) != 0).view(np.uint8)
+    map_height, map_width = pixel_art_map.shape
+    base_height, base_width = base_pattern.shape
+    shape = (map_height * base_height, map_width * base_width)
+
+    if out is None:
+        out = np.empty(shape, dtype=np.uint8)
+    elif out.shape != shape or out.dtype != np.uint8 or not out.flags.c_contiguous:
+        raise ValueError(f"out must be a C-contiguous uint8 array of shape {shape}.")
+
+    fill_tiles = _load_fill_tiles()
+    if fill_tiles is not None:
+        out.fill(DEAD)
+        fill_tiles(pixel_art_map, base_pattern, out)
+        return out
+
+    # Viewed as (map row, base row, map col, base col), each cell of out is
+    # just pixel_art_map[map_r, map_c] * base_pattern[r, c]; multiplying
+    # straight into that view avoids np.kron's full-size temporaries.
+    np.multiply(
+        pixel_art_map[:, None, :, None],
+        base_pattern[None, :, None, :],
+        out=out.reshape(map_height, base_height, map_width, base_width),
+    )
+    return out
+
+
+def encode_tiled_rle_to(pixel_art_map: np.ndarray, base_pattern: np.ndarray, fileobj: TextIO) -> int:
+    """
+    Encodes create_pixel_art_grid(pixel_art_map, base_pattern) straight to RLE
+    without building the tiled grid, writing it to fileobj row by row.
+    Returns the number of characters written.
+
+    Every alive tile emits the same tokens for a given base pattern row, so
+    each base row is encoded once up front. A tiled row then just places
+    those tokens at each alive tile, with dead-cell runs for the gaps in
+    between; the work scales with the number of tiles instead of cells.
+    """
+    # Treat any nonzero cell as alive, as encode_rle_to does
+    pixel_art_map = (np.asarray(pixel_art_map) != 0).view(np.uint8)
+    base_pattern = (np.asarray(base_pattern) != 0).view(np.uint8)
+    if base_pattern.size == 0 or pixel_art_map.size == 0:
+        return encode_rle_to(np.zeros((0, 0), dtype=np.uint8), fileobj)
+
+    base_height, base_width = base_pattern.shape
+
+    # Per base row: leading dead cells, the tokens of its live span and the
+    # span's width, or None when the row is all dead
+    bands = []
+    for base_row in base_pattern:
+        alive = np.flatnonzero(base_row)
+        if alive.size == 0:
+            bands.append(None)
+            continue
+        lead, trail = int(alive[0]), base_width - 1 - int(alive[-1])
+        if lead == 0 and trail == 0:
+            # Live spans of adjacent tiles would touch and their runs would
+            # have to be merged; encode the full grid instead.
+            return encode_rle_to(create_pixel_art_grid(pixel_art_map, base_pattern), fileobj)
+        bands.append((lead, _encode_rle_row(base_row[lead:]), base_width - lead - trail))
+
+    def tiled_rows():
+        for map_r in np.flatnonzero(np.any(pixel_art_map, axis=1)).tolist():
+            tile_starts = np.flatnonzero(pixel_art_map[map_r]) * base_width
+            for r, band in enumerate(bands):
+                if band is None:
+                    continue
+                lead, span_tokens, span_width = band
+                span_starts = tile_starts + lead
+                # Dead cells between the end of the previous span (or the row
+                # start, via the -span_width sentinel) and this one
+                gaps = np.diff(span_starts, prepend=-span_width) - span_width
+                yield map_r * base_height + r, ''.join(
+                    (f"{gap}b" if gap > 1 else 'b' if gap else '') + span_tokens
+                    for gap in gaps.tolist()
+                )
+
+    return _write_rle_rows(tiled_rows(), fileobj)
+
+
+def pipeline(
+    image_path: str,
+    threshold: int,
+    base_mask: np.ndarray,
+    output_path: str,
+    rule: str
+) -> Tuple[np.ndarray, Tuple[int, int], int]:
+    """
+    Runs the whole image -> pixel map -> tiled grid -> RLE conversion on uint8
+    ndarrays and streams the RLE file to output_path.
+
+    Only the small pixel map is materialized; the tiled grid is encoded
+    directly from it by encode_tiled_rle_to, which writes each row as it goes.
+
+    Returns:
+        The pixel map the image was converted to (for reporting), the
+        (height, width) of the tiled grid and the number of pattern data
+        characters written.
+    """
+    pixel_map = image_to_pixel_map(image_path, threshold)
+    if pixel_map.size == 0:
+        raise ValueError("Image processing failed or pixel map is empty.")
+
+    final_height = pixel_map.shape[0] * base_mask.shape[0]
+    final_width = pixel_map.shape[1] * base_mask.shape[1]
+    with open(output_path, "w", buffering=1 << 20) as f:
+        f.write(f"x = {final_width}, y = {final_height}, rule = {rule}\n")
+        data_length = encode_tiled_rle_to(pixel_map, base_mask, f)
+
+    return pixel_map, (final_height, final_width), data_length
 
 
 # --- CONFIGURATION AND DEMONSTRATION ---
@@ -242,64 +398,50 @@ GLIDER_GRID = [
     ['.','.','o', 'o', 'o', '.', '.'],
     ['.','.','.', '.', '.', '.', '.'],
 ]
+GLIDER_MASK = np.array([[ALIVE if c == 'o' else DEAD for c in row] for row in GLIDER_GRID], dtype=np.uint8)
 
 # --- USER CONFIGURATION ---
-IMAGE_PATH = sys.argv[1] # <-- !!! CHANGE THIS TO YOUR IMAGE FILE PATH !!!
-BRIGHTNESS_THRESHOLD = int(sys.argv[2])     # Pixels brighter than this (0-255) get a Glider.
 GAME_OF_LIFE_RULE = 'B3/S23'   # Standard Conway's Game of Life rule
+OUTPUT_PATH = "RLE.txt"        # Where the generated RLE file is written
 # -------------------------
 
 
-print("--- 1. Generating Pixel Map from Image ---")
-try:
-    # 1. Convert the image file to a low-res pixel map
-    pixel_map = image_to_pixel_map(IMAGE_PATH, BRIGHTNESS_THRESHOLD)
+if __name__ == "__main__":
+    IMAGE_PATH = sys.argv[1] # <-- !!! CHANGE THIS TO YOUR IMAGE FILE PATH !!!
+    BRIGHTNESS_THRESHOLD = int(sys.argv[2])     # Pixels brighter than this (0-255) get a Glider.
 
-    if not pixel_map:
-        raise ValueError("Image processing failed or pixel map is empty.")
-        
-    map_width = len(pixel_map[0])
-    map_height = len(pixel_map)
-
-    print(f"Image successfully converted to {map_width}x{map_height} pixel map.")
-    print("Example rows from the Pixel Map ('o' = Glider, '.' = Empty):")
-    for row in pixel_map[:5]:
-        print("".join(row))
-    if map_height > 5:
-        print("...")
-
-    print("\n" + "="*50 + "\n")
-
-    print("--- 2. Tiling Gliders to Create Final RLE Grid ---")
-
-    # 2. Use the pixel map to tile the Glider pattern
-    final_glider_art_grid = create_pixel_art_grid(pixel_map, GLIDER_GRID)
-    
-    # 3. Calculate final RLE dimensions
-    glider_width = len(GLIDER_GRID[0])
-    glider_height = len(GLIDER_GRID)
-    final_width = map_width * glider_width
-    final_height = map_height * glider_height
-    
-    # 4. Encode the new grid
-    final_rle_data = encode_rle(final_glider_art_grid)
-
-    # 5. Create the final RLE file content with the new header
-    full_final_rle_output = f"x = {final_width}, y = {final_height}, rule = {GAME_OF_LIFE_RULE}\n{final_rle_data}"
-
-    print(f"Generated Glider Art Grid size: {final_width}x{final_height}")
-    print(f"Generated RLE Output (first 300 characters):")
-    print(full_final_rle_output[:300] + ('...' if len(full_final_rle_output) > 300 else ''))
-    print(f"\nTotal length of RLE string: {len(final_rle_data)}")
-    print("\n--- RLE Data Ready for Game of Life Simulator ---\n")
-    # Output the full RLE data for easy copying/saving
-    # print(full_final_rle_output)
-    with open("RLE.txt", "w") as f:
-        f.write(full_final_rle_output)
-    print("Wrote RLE to RLE.txt")
-
-
-except ValueError as e:
-    print(f"Error in Glider Art Generation: {e}")
-except Exception as e:
-    print(f"An unexpected error occurred: {e}")
+    print("--- 1. Generating Pixel Map from Image ---")
+    try:
+        # Image -> pixel map -> tiled Glider grid -> RLE, streamed to OUTPUT_PATH
+        pixel_map, (final_height, final_width), data_length = pipeline(
+            IMAGE_PATH, BRIGHTNESS_THRESHOLD, GLIDER_MASK, OUTPUT_PATH, GAME_OF_LIFE_RULE
+        )
+
+        map_height, map_width = pixel_map.shape
+
+        print(f"Image successfully converted to {map_width}x{map_height} pixel map.")
+        print("Example rows from the Pixel Map ('o' = Glider, '.' = Empty):")
+        for row in np.where(pixel_map[:5], 'o', '.'):
+            print("".join(row))
+        if map_height > 5:
+            print("...")
+
+        print("\n" + "="*50 + "\n")
+
+        print("--- 2. Tiling Gliders to Create Final RLE Grid ---")
+
+        with open(OUTPUT_PATH) as f:
+            preview = f.read(301)
+
+        print(f"Generated Glider Art Grid size: {final_width}x{final_height}")
+        print(f"Generated RLE Output (first 300 characters):")
+        print(preview[:300] + ('...' if len(preview) > 300 else ''))
+        print(f"\nTotal length of RLE string: {data_length}")
+        print("\n--- RLE Data Ready for Game of Life Simulator ---\n")
+        print(f"Wrote RLE to {OUTPUT_PATH}")
+
+
+    except ValueError as e:
+        print(f"Error in Glider Art Generation: {e}")
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")